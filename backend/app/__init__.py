@@ -5,6 +5,7 @@ from flask_cors import CORS
 from .config import Config
 from .extensions import bcrypt, db, jwt, migrate
 from .routes import register_blueprints
+from .services.llm_service import warm_up_llm_client
 
 load_dotenv()
 
@@ -29,6 +30,8 @@ def create_app(config_class: type[Config] | None = None) -> Flask:
         # Ensure tables exist so first-time developers can run without migrations
         db.create_all()
 
+    warm_up_llm_client(app)
+
     return app
 
 
@@ -11,6 +11,10 @@ class Config:
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
     HUGGINGFACE_API_KEY = os.getenv("HUGGINGFACE_API_KEY")
+    # Reuse replies for paraphrased prompts (requires sentence-transformers)
+    LLM_SEMANTIC_CACHE = os.getenv("LLM_SEMANTIC_CACHE", "false").lower() == "true"
+    # Send a one-token completion at startup to wake a cold model endpoint (billed per app instance)
+    LLM_WARMUP = os.getenv("LLM_WARMUP", "false").lower() == "true"
     ELEVENLABS_API_KEY = os.getenv("ELEVENLABS_API_KEY")
     ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "pNInz6obpgDQGcFmaJgB")
     FRONTEND_URL = os.getenv("FRONTEND_URL", "http://localhost:5173")
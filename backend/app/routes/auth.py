@@ -2,7 +2,6 @@ import json
 import os
 from flask import Blueprint, current_app, jsonify, request
 from flask_jwt_extended import create_access_token, get_jwt_identity, jwt_required
-from google_auth_oauthlib.flow import InstalledAppFlow
 
 from ..extensions import db
 from ..models import User
@@ -71,6 +70,8 @@ def google_login():
     if not code:
         return jsonify({"message": "Authorization code is required"}), 400
 
+    from google_auth_oauthlib.flow import InstalledAppFlow  # heavy import, only needed for OAuth
+
     try:
         creds_file = os.path.join(os.getcwd(), "credentials.json")
 
@@ -1,7 +1,8 @@
 import os
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Blueprint, jsonify, request
 from flask_jwt_extended import jwt_required, get_jwt_identity
-from google_auth_oauthlib.flow import InstalledAppFlow
 
 from ..services.elevenlabs_service import synthesize_speech
 from ..services.llm_service import generate_action_reply
@@ -10,6 +11,9 @@ from ..services.google_calendar import get_auth_url
 
 voice_bp = Blueprint("voice", __name__)
 
+# Runs commands that can start before the LLM reply has finished streaming
+_action_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="voice-action")
+
 
 @voice_bp.get("/greeting")
 @jwt_required()
@@ -43,14 +47,25 @@ def process_voice():
     user_id = get_jwt_identity()
     processor = VoiceCommandProcessor(user_id=user_id)
 
-    action, reply = generate_action_reply(transcript)
+    pending = {}
+
+    def start_action(streamed_action: str) -> None:
+        # Overlap calendar creation with the rest of the LLM reply
+        if streamed_action == "schedule_meeting":
+            pending["schedule"] = _action_executor.submit(processor.create_calendar_event, transcript)
+
+    action, reply = generate_action_reply(transcript, on_action=start_action)
     command_result = None
     auth_url = None
     action_type = action
 
     # Delegate to richer processor when intent is clear
-    if action == "schedule_meeting":
-        command_result = processor.create_calendar_event(transcript)
+    if action == "schedule_meeting" or "schedule" in pending:
+        action_type = action = "schedule_meeting"
+        if "schedule" in pending:
+            command_result = pending["schedule"].result()
+        else:
+            command_result = processor.create_calendar_event(transcript)
 
         # If scheduling failed due to missing creds/connection, surface auth URL
         if command_result and not command_result.get("success"):
@@ -95,6 +110,8 @@ def google_callback():
     if not code:
         return jsonify({"success": False, "message": "No code provided"}), 400
 
+    from google_auth_oauthlib.flow import InstalledAppFlow  # heavy import, only needed for OAuth
+
     try:
         creds_file = os.path.join(os.getcwd(), "credentials.json")
         
@@ -117,13 +134,8 @@ def google_callback():
         creds = flow.credentials
 
         # Persist tokens for reuse
-        token_path = os.path.join(os.getcwd(), "token.pickle")
         token_json_path = os.path.join(os.getcwd(), "token.json")
         try:
-            with open(token_path, "wb") as token_file:
-                import pickle
-
-                pickle.dump(creds, token_file)
             with open(token_json_path, "w") as token_json_file:
                 token_json_file.write(creds.to_json())
         except Exception:
@@ -8,15 +8,15 @@ from .datetime_parser import parse_natural_language_datetime
 
 logger = logging.getLogger(__name__)
 
-def create_event_manual_parse(conversation_text, get_calendar_service):
+# Titles extract_event_summary falls back to when it finds nothing usable
+PLACEHOLDER_SUMMARIES = frozenset({"Untitled Event", "New Event"})
+
+def extract_event_summary(conversation_text):
     """
-    Manually parses conversation text to create a calendar event.
-    This is a fallback if quickAdd fails.
-    Returns a structured dictionary with success status and event details.
+    Pull a short event title out of a natural-language request.
     """
-    logger.info(f"Attempting manual parse for event: {conversation_text}")
     summary = "Untitled Event"
-    
+
     # Simple regex to find common patterns for event summary
     # This regex is improved to be more robust
     summary_match = re.search(r'(?:schedule|create|add)\s+(?:a\s+)?(.+?)(?:\s+(?:on|at|for|from)\s+.*|$)', conversation_text, re.IGNORECASE)
@@ -33,99 +33,120 @@ def create_event_manual_parse(conversation_text, get_calendar_service):
         if len(summary) > 100: # Prevent very long summaries
             summary = summary[:100] + "..."
 
+    return summary
+
+def _event_window(datetime_result):
+    """Return (start, end) for a parsed result; dates for all-day events, datetimes otherwise."""
+    if datetime_result.get('is_all_day', False):
+        start_date = datetime_result.get('start_date')
+        return start_date, start_date + timedelta(days=1)
+
+    start_time = datetime_result.get('start_datetime')
+    # If end time is specified in the datetime_result, use it
+    # Otherwise default to 1 hour after start time
+    if 'end_datetime' in datetime_result:
+        return start_time, datetime_result.get('end_datetime')
+    return start_time, start_time + timedelta(hours=1)
+
+def build_event_body(summary, datetime_result, conversation_text, time_zone='UTC'):
+    """
+    Build the events().insert body for a parsed request without sending it.
+    Naive datetimes are interpreted in time_zone, normally the calendar's own.
+    """
+    start, end = _event_window(datetime_result)
+
+    if datetime_result.get('is_all_day', False):
+        return {
+            'summary': summary,
+            'start': {
+                'date': start.strftime('%Y-%m-%d'),
+            },
+            'end': {
+                'date': end.strftime('%Y-%m-%d'),
+            },
+            'description': conversation_text
+        }
+
+    return {
+        'summary': summary,
+        'start': {
+            'dateTime': start.isoformat(),
+            'timeZone': time_zone,
+        },
+        'end': {
+            'dateTime': end.isoformat(),
+            'timeZone': time_zone,
+        },
+        'description': conversation_text
+    }
+
+def build_event_result(summary, datetime_result, created_event):
+    """
+    Shape the structured success response for an event created from a parsed request.
+    """
+    start, end = _event_window(datetime_result)
+    date_str = start.strftime('%B %d, %Y')
+
+    if datetime_result.get('is_all_day', False):
+        return {
+            'success': True,
+            'event': {
+                'id': created_event.get('id'),
+                'summary': summary,
+                'htmlLink': created_event.get('htmlLink', ''),
+                'date': date_str,
+                'is_all_day': True
+            },
+            'message': f"✅ All-day event created: '{summary}' on {date_str}"
+        }
+
+    start_str = start.strftime('%I:%M %p')
+    end_str = end.strftime('%I:%M %p')
+
+    return {
+        'success': True,
+        'event': {
+            'id': created_event.get('id'),
+            'summary': summary,
+            'htmlLink': created_event.get('htmlLink', ''),
+            'date': date_str,
+            'start_time': start_str,
+            'end_time': end_str,
+            'is_all_day': False
+        },
+        'message': f"✅ Event created: '{summary}' on {date_str} from {start_str} to {end_str}"
+    }
+
+def create_event_manual_parse(conversation_text, get_calendar_service, datetime_result=None, time_zone='UTC'):
+    """
+    Manually parses conversation text to create a calendar event.
+    Callers that already ran parse_natural_language_datetime can pass its
+    result as datetime_result to skip parsing the text twice; time_zone is
+    the zone the parsed wall-clock times belong to.
+    Returns a structured dictionary with success status and event details.
+    """
+    logger.info(f"Attempting manual parse for event: {conversation_text}")
+    summary = extract_event_summary(conversation_text)
+
     # Try to parse date/time from the text using the enhanced function
-    datetime_result = parse_natural_language_datetime(conversation_text)
-    
+    if datetime_result is None:
+        datetime_result = parse_natural_language_datetime(conversation_text)
+
     if not datetime_result.get('success', True):  # Default to True if 'success' key isn't present
         logger.warning(f"Failed to parse date/time information: {datetime_result.get('error', 'Unknown error')}")
         return {
-            'success': False, 
+            'success': False,
             'error': 'Could not understand the date and time for this event',
             'message': f"❌ Could not understand when this event should be scheduled. Please try again with a clearer date and time."
         }
-    
+
     # Create the event
     try:
         service = get_calendar_service()
-        
-        if datetime_result.get('is_all_day', False):
-            # Create all-day event
-            start_date = datetime_result.get('start_date')
-            event = {
-                'summary': summary,
-                'start': {
-                    'date': start_date.strftime('%Y-%m-%d'),
-                },
-                'end': {
-                    'date': (start_date + timedelta(days=1)).strftime('%Y-%m-%d'),
-                },
-                'description': conversation_text
-            }
-            
-            created_event = service.events().insert(calendarId='primary', body=event).execute()
-            
-            date_str = start_date.strftime('%B %d, %Y')
-            
-            result = {
-                'success': True,
-                'event': {
-                    'id': created_event.get('id'),
-                    'summary': summary,
-                    'htmlLink': created_event.get('htmlLink', ''),
-                    'date': date_str,
-                    'is_all_day': True
-                },
-                'message': f"✅ All-day event created: '{summary}' on {date_str}"
-            }
-            
-            return result
-        else:
-            # Create timed event
-            start_time = datetime_result.get('start_datetime')
-            
-            # If end time is specified in the datetime_result, use it
-            # Otherwise default to 1 hour after start time
-            if 'end_datetime' in datetime_result:
-                end_time = datetime_result.get('end_datetime')
-            else:
-                end_time = start_time + timedelta(hours=1)
-            
-            event = {
-                'summary': summary,
-                'start': {
-                    'dateTime': start_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': end_time.isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'description': conversation_text
-            }
-            
-            created_event = service.events().insert(calendarId='primary', body=event).execute()
-            
-            # Create response dictionary
-            date_str = start_time.strftime('%B %d, %Y')
-            start_str = start_time.strftime('%I:%M %p')
-            end_str = end_time.strftime('%I:%M %p')
-            
-            result = {
-                'success': True,
-                'event': {
-                    'id': created_event.get('id'),
-                    'summary': summary,
-                    'htmlLink': created_event.get('htmlLink', ''),
-                    'date': date_str,
-                    'start_time': start_str,
-                    'end_time': end_str,
-                    'is_all_day': False
-                },
-                'message': f"✅ Event created: '{summary}' on {date_str} from {start_str} to {end_str}"
-            }
-            
-            return result
-        
+        event = build_event_body(summary, datetime_result, conversation_text, time_zone)
+        created_event = service.events().insert(calendarId='primary', body=event, fields='id,htmlLink,summary').execute()
+        return build_event_result(summary, datetime_result, created_event)
+
     except Exception as e:
         logger.error(f"Error in manual event parsing: {e}")
         return {
@@ -6,26 +6,34 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Any of these without an explicit time turns the request into an all-day event
+_DAY_KEYWORDS_RE = re.compile(
+    r'\b(?:tomorrow|today|(?:mon|tues|wednes|thurs|fri|satur|sun)day|next\s+week|weekend)',
+    re.IGNORECASE,
+)
+
 def parse_natural_language_datetime(text):
     """
     Parse natural language datetime expressions.
     Returns a dictionary with the parsing results including success status,
     extracted date/time, and whether it's an all-day event.
     """
-    text = text.lower().strip()
+    text = text.strip()
+    # Lowercased copy for the plain substring checks; regexes match case-insensitively on text
+    text_lc = text.lower()
     now = datetime.now()
     is_all_day = False
     
     # Check for "all day" markers
-    if re.search(r'\b(all[- ]?day|full[- ]?day)\b', text):
+    if re.search(r'\b(all[- ]?day|full[- ]?day)\b', text, re.IGNORECASE):
         is_all_day = True
     
     # Day/date detection - enhanced with more patterns
-    if 'tomorrow' in text:
+    if 'tomorrow' in text_lc:
         base_date = now + timedelta(days=1)
-    elif 'today' in text:
+    elif 'today' in text_lc:
         base_date = now
-    elif 'day after tomorrow' in text:
+    elif 'day after tomorrow' in text_lc:
         base_date = now + timedelta(days=2)
     elif re.search(r'next\s+monday', text, re.IGNORECASE):
         days_ahead = (7 - now.weekday()) % 7
@@ -66,9 +74,9 @@ def parse_natural_language_datetime(text):
         # Assume this weekend means the upcoming Saturday
         days_ahead = (5 - now.weekday()) % 7
         base_date = now + timedelta(days=days_ahead)
-    elif 'next week' in text:
+    elif 'next week' in text_lc:
         base_date = now + timedelta(weeks=1)
-    elif 'next month' in text:
+    elif 'next month' in text_lc:
         base_date = now + relativedelta(months=1)
     else:
         try:
@@ -89,11 +97,14 @@ def parse_natural_language_datetime(text):
     ]
     
     end_datetime = None
+    # The exact substring the time was read from, so callers can tell whether other time phrases remain
+    time_text = None
     
     for pattern in time_range_patterns:
-        match = re.search(pattern, text)
+        match = re.search(pattern, text, re.IGNORECASE)
         if match:
             time_found = True
+            time_text = match.group(0)
             groups = match.groups()
             
             # Process start time
@@ -162,9 +173,10 @@ def parse_natural_language_datetime(text):
         ]
         
         for pattern in time_patterns:
-            match = re.search(pattern, text)
+            match = re.search(pattern, text, re.IGNORECASE)
             if match:
                 time_found = True
+                time_text = match.group(0)
                 groups = match.groups()
                 
                 if len(groups) == 3:  # HH:MM AM/PM
@@ -178,7 +190,7 @@ def parse_natural_language_datetime(text):
                         hour = 0
                         
                 elif len(groups) == 2:
-                    if groups[1] in ['am', 'pm']:  # HH AM/PM
+                    if groups[1].lower() in ['am', 'pm']:  # HH AM/PM
                         hour = int(groups[0])
                         minute = 0
                         ampm = groups[1]
@@ -200,10 +212,7 @@ def parse_natural_language_datetime(text):
     # If no time specification found and it's not explicitly an all-day event
     if not time_found and not is_all_day:
         # If there are day-related keywords but no time, make it an all-day event
-        day_keywords = ['tomorrow', 'today', 'monday', 'tuesday', 'wednesday', 
-                      'thursday', 'friday', 'saturday', 'sunday', 'next week', 'weekend']
-        
-        if any(keyword in text.lower() for keyword in day_keywords):
+        if _DAY_KEYWORDS_RE.search(text):
             is_all_day = True
             # Set time to beginning of day
             base_date = base_date.replace(hour=0, minute=0, second=0, microsecond=0)
@@ -222,6 +231,8 @@ def parse_natural_language_datetime(text):
         result['start_datetime'] = base_date
         if end_datetime:
             result['end_datetime'] = end_datetime
+        if time_text:
+            result['time_text'] = time_text
             
     return result
 
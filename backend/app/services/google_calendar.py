@@ -2,12 +2,11 @@ import logging
 import os
 import json
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
 from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 
 from ..extensions import db
@@ -22,13 +21,21 @@ def _build_service(access_token: str):
         return None
 
     try:
-        creds = Credentials(token=access_token)
-        return build("calendar", "v3", credentials=creds, cache_discovery=False)
+        return _service_for_token(access_token)
     except Exception as exc:  # pylint: disable=broad-except
         logger.warning("Failed to initialize Google Calendar service: %s", exc)
         return None
 
 
+@lru_cache(maxsize=64)
+def _service_for_token(access_token: str):
+    # Imported lazily: googleapiclient.discovery pulls in httplib2 and friends
+    from .google_client import build_calendar_service
+
+    # Clients are reused per token so repeat requests skip discovery parsing and the TLS handshake
+    return build_calendar_service(Credentials(token=access_token))
+
+
 def list_upcoming_events(
     access_token: str, max_results: int = 10, days_ahead: int = 7
 ) -> List[Dict[str, Any]]:
@@ -82,6 +89,8 @@ __all__ = ["list_upcoming_events", "create_event", "get_auth_url"]
 
 def get_auth_url() -> str:
     """Generate a Google OAuth URL for the frontend to open."""
+    from google_auth_oauthlib.flow import InstalledAppFlow  # heavy import, only needed for OAuth
+
     creds_file = os.path.join(os.getcwd(), "credentials.json")
     flow = InstalledAppFlow.from_client_secrets_file(
         creds_file,
@@ -105,7 +114,9 @@ def get_service_for_user(user_id: str):
             user.google_credentials = json.loads(creds.to_json())
             db.session.commit()
 
-        return build("calendar", "v3", credentials=creds, cache_discovery=False)
+        from .google_client import build_calendar_service  # see _service_for_token
+
+        return build_calendar_service(creds)
     except Exception as exc:  # pragma: no cover
         logger.warning("Failed to load calendar creds for user %s: %s", user_id, exc)
         return None
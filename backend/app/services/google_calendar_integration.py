@@ -1,15 +1,27 @@
 ﻿import os
+import re
 import pickle
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Dict, Any, List
+import threading
+from concurrent.futures import Future
+from datetime import datetime, time, timedelta, timezone
+from functools import lru_cache, wraps
+from typing import Dict, Any, List, Optional, Tuple
+import numpy as np
+import orjson
+from cachetools.func import ttl_cache
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from dateutil import parser
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:  # pragma: no cover
+    def _parse_iso(value: str) -> datetime:
+        """Stdlib fallback; fromisoformat only accepts a trailing Z from Python 3.11."""
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+from .calendar_event_parser import PLACEHOLDER_SUMMARIES, build_event_body, build_event_result, extract_event_summary
 from .calendar_event_parser import create_event_manual_parse as manual_event_parser
+from .datetime_parser import parse_natural_language_datetime
 logger = logging.getLogger(__name__)
 SCOPES = ["https://www.googleapis.com/auth/calendar"]
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -17,37 +29,92 @@ TOKEN_PATH = os.path.join(BASE_DIR, "token.pickle")
 TOKEN_JSON_PATH = os.path.join(BASE_DIR, "token.json")
 CREDENTIALS_PATH = os.path.join(BASE_DIR, "credentials.json")
 _cached_calendar_service = None
+_cached_creds = None
+_token_mtime = None
+_auth_lock = threading.RLock()
+_CREDS_EXPIRY_MARGIN = timedelta(seconds=60)
+# Only the attributes _normalize_event reads are requested from list endpoints
+_EVENT_LIST_FIELDS = "items(id,summary,start,end,htmlLink,location)"
+_BATCH_LIMIT = 50  # Calendar API cap on requests per batch
+_UTC = timezone.utc
+_WORKDAY_START = time(9, 0)
+_WORKDAY_END = time(17, 0)
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+# Clock times the local parser may have skipped; any left after its match means the text is ambiguous
+_TIME_TOKEN_RE = re.compile(r"\b\d{1,2}(?::\d{2})?\s*(?:am|pm)\b|\b\d{1,2}:\d{2}\b|\b(?:noon|midnight)\b", re.IGNORECASE)
+# Day or date words left in a title mean the summary heuristic swallowed part of the schedule
+_DATE_WORD_RE = re.compile(
+    r"\b(?:today|tonight|tomorrow|next|this|week|weekend|month"
+    r"|(?:mon|tues|wednes|thurs|fri|satur|sun)day"
+    r"|jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    r"|sept?(?:ember)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)\b|\d",
+    re.IGNORECASE,
+)
+
+
+def _save_creds(creds: Credentials) -> None:
+    with open(TOKEN_JSON_PATH, "w") as token_json:
+        token_json.write(creds.to_json())
+
+
+def _token_mtime_now() -> Optional[float]:
+    try:
+        return os.stat(TOKEN_JSON_PATH).st_mtime
+    except OSError:
+        return None
+
+
+def _creds_still_fresh(creds: Credentials) -> bool:
+    """Valid and not within _CREDS_EXPIRY_MARGIN of expiring (google-auth expiry is naive UTC)."""
+    if not creds.valid:
+        return False
+    return creds.expiry is None or creds.expiry - _now().replace(tzinfo=None) > _CREDS_EXPIRY_MARGIN
 
 
 def _load_creds() -> Credentials:
+    """Return cached credentials while token.json is unchanged and they are not about to expire."""
+    global _cached_creds, _token_mtime
+    with _auth_lock:
+        mtime = _token_mtime_now()
+        if _cached_creds is not None and mtime is not None and mtime == _token_mtime and _creds_still_fresh(_cached_creds):
+            return _cached_creds
+        _cached_creds = _read_creds()
+        _token_mtime = _token_mtime_now()
+        return _cached_creds
+
+
+def _read_creds() -> Credentials:
     """Load and refresh credentials if possible; returns None when user action is required."""
     creds = None
 
-    # Try pickle first (existing flow)
-    if os.path.exists(TOKEN_PATH):
+    # JSON token written by the OAuth callback and by refreshes
+    if os.path.exists(TOKEN_JSON_PATH):
         try:
-            with open(TOKEN_PATH, "rb") as token:
-                creds = pickle.load(token)
+            with open(TOKEN_JSON_PATH, "rb") as token_json:
+                creds = Credentials.from_authorized_user_info(orjson.loads(token_json.read()), SCOPES)
         except Exception as exc:  # pragma: no cover
-            logger.error("Failed to load token.pickle: %s", exc)
+            logger.error("Failed to load token.json: %s", exc)
             creds = None
 
-    # Fallback to JSON token generated by OAuth callback
-    if creds is None and os.path.exists(TOKEN_JSON_PATH):
+    # Legacy token.pickle from older installs: migrate it to JSON once
+    if creds is None and os.path.exists(TOKEN_PATH):
         try:
-            creds = Credentials.from_authorized_user_file(TOKEN_JSON_PATH, SCOPES)
+            with open(TOKEN_PATH, "rb") as token:
+                creds = pickle.load(token)
+            _save_creds(creds)
+            os.remove(TOKEN_PATH)
         except Exception as exc:  # pragma: no cover
-            logger.error("Failed to load token.json: %s", exc)
+            logger.error("Failed to migrate token.pickle: %s", exc)
             creds = None
 
     # Refresh if expired and refresh token exists
     if creds and creds.expired and creds.refresh_token:
         try:
             creds.refresh(Request())
-            with open(TOKEN_PATH, "wb") as token:
-                pickle.dump(creds, token)
-            with open(TOKEN_JSON_PATH, "w") as token_json:
-                token_json.write(creds.to_json())
+            _save_creds(creds)
         except Exception as exc:  # pragma: no cover
             logger.error("Failed to refresh Google creds: %s", exc)
             creds = None
@@ -67,6 +134,8 @@ def get_auth_url(redirect_uri: str = None) -> Dict[str, Any]:
     if not os.path.exists(CREDENTIALS_PATH):
         raise FileNotFoundError("credentials.json not found in backend directory")
 
+    from google_auth_oauthlib.flow import InstalledAppFlow  # heavy import, only needed for OAuth
+
     flow = InstalledAppFlow.from_client_secrets_file(CREDENTIALS_PATH, SCOPES)
     flow.redirect_uri = redirect_uri or os.environ.get(
         "GOOGLE_REDIRECT_URI", "http://localhost:3000/oauth2callback"
@@ -82,13 +151,82 @@ def authenticate_google_calendar():
     if not creds:
         return None
 
-    return build("calendar", "v3", credentials=creds, cache_discovery=False)
+    # Imported lazily: googleapiclient.discovery pulls in httplib2 and friends
+    from .google_client import build_calendar_service
+
+    return build_calendar_service(creds)
 def get_calendar_service():
     global _cached_calendar_service
     if _cached_calendar_service is None:
-        _cached_calendar_service = authenticate_google_calendar()
+        # Concurrent first requests must not each run the auth flow
+        with _auth_lock:
+            if _cached_calendar_service is None:
+                _cached_calendar_service = authenticate_google_calendar()
     return _cached_calendar_service
 # --------------------------- Read helpers ---------------------------
+def _now() -> datetime:
+    """Current time as an aware UTC datetime; replaces the deprecated utcnow()."""
+    return datetime.now(_UTC)
+def _rfc3339(dt: datetime) -> str:
+    """Format a UTC datetime as the RFC 3339 timestamp the Calendar API expects."""
+    return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
+def _list_events(
+    service,
+    time_min: datetime,
+    time_max: Optional[datetime] = None,
+    max_results: Optional[int] = None,
+    fields: str = _EVENT_LIST_FIELDS,
+) -> List[Dict[str, Any]]:
+    """List expanded primary-calendar events in start order; only the time window varies per caller."""
+    events_result = (
+        service.events()
+        .list(
+            calendarId="primary",
+            timeMin=_rfc3339(time_min),
+            timeMax=_rfc3339(time_max) if time_max else None,
+            maxResults=max_results,
+            singleEvents=True,
+            orderBy="startTime",
+            fields=fields,
+        )
+        .execute()
+    )
+    return events_result.get("items", [])
+def _display_date(value: datetime) -> str:
+    """Same output as strftime("%B %d, %Y") without re-parsing the format each call."""
+    return f"{_MONTHS[value.month - 1]} {value.day:02d}, {value.year}"
+def _display_time(value: datetime) -> str:
+    """Same output as strftime("%I:%M %p")."""
+    return f"{(value.hour - 1) % 12 + 1:02d}:{value.minute:02d} {'AM' if value.hour < 12 else 'PM'}"
+@lru_cache(maxsize=4096)
+def _iso_to_display(iso_value: str) -> Tuple[str, str]:
+    """Parse an event dateTime once and return its (date, time) display strings."""
+    value = datetime.fromisoformat(iso_value.replace("Z", "+00:00"))
+    return _display_date(value), _display_time(value)
+@ttl_cache(maxsize=32, ttl=60)
+def _list_day_events(service, day_start: datetime, day_end: datetime) -> List[Dict[str, Any]]:
+    """_list_events for a whole day, reused for a minute so dashboard refreshes skip the round-trip."""
+    return _list_events(service, day_start, day_end)
+@ttl_cache(maxsize=128, ttl=30)
+def _query_busy(service, calendar_ids: Tuple[str, ...], time_min: str, time_max: str) -> Dict[str, List[Dict[str, str]]]:
+    """Freebusy blocks per calendar id, cached briefly since repeated queries are common under interactive use."""
+    result = (
+        service.freebusy()
+        .query(body={"timeMin": time_min, "timeMax": time_max, "items": [{"id": cid} for cid in calendar_ids]})
+        .execute()
+    )
+    calendars = result.get("calendars", {})
+    return {cid: calendars.get(cid, {}).get("busy", []) for cid in calendar_ids}
+def _invalidates_reads(func):
+    """Drop cached reads after a write so the next query sees the new event."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _list_day_events.cache_clear()
+            _query_busy.cache_clear()
+    return wrapper
 def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
     start = event.get("start", {})
     end = event.get("end", {})
@@ -97,15 +235,12 @@ def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
     summary = event.get("summary") or "Untitled Event"
     is_all_day = "T" not in start_val if start_val else False
     if start_val and "T" in start_val:
-        start_dt = datetime.fromisoformat(start_val.replace("Z", "+00:00"))
-        date_str = start_dt.strftime("%B %d, %Y")
-        start_time = start_dt.strftime("%I:%M %p")
+        date_str, start_time = _iso_to_display(start_val)
     else:
         date_str = start_val
         start_time = None
     if end_val and "T" in end_val:
-        end_dt = datetime.fromisoformat(end_val.replace("Z", "+00:00"))
-        end_time = end_dt.strftime("%I:%M %p")
+        end_time = _iso_to_display(end_val)[1]
     else:
         end_time = None
     return {
@@ -118,35 +253,23 @@ def _normalize_event(event: Dict[str, Any]) -> Dict[str, Any]:
         "htmlLink": event.get("htmlLink"),
         "location": event.get("location"),
     }
+def _format_event(event: Dict[str, Any]) -> str:
+    """Render a raw event as a single spoken schedule line."""
+    norm = _normalize_event(event)
+    when = "All day" if norm["is_all_day"] else norm.get("start_time")
+    loc = f" at {norm['location']}" if norm.get("location") else ""
+    return f"{norm['summary']} at {when}{loc}"
 def get_today_schedule() -> str:
     try:
         service = get_calendar_service()
         if service is None:
             return "Google Calendar authorization required"
-        now = datetime.utcnow()
-        today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        today_start = datetime.combine(_now().date(), time.min, tzinfo=_UTC)
         today_end = today_start + timedelta(days=1)
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=today_start.isoformat() + "Z",
-                timeMax=today_end.isoformat() + "Z",
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
-        events = events_result.get("items", [])
+        events = _list_day_events(service, today_start, today_end)
         if not events:
             return "No events scheduled for today"
-        parts = []
-        for evt in events:
-            norm = _normalize_event(evt)
-            when = "All day" if norm["is_all_day"] else norm.get("start_time")
-            loc = f" at {norm['location']}" if norm.get("location") else ""
-            parts.append(f"{norm['summary']} at {when}{loc}")
-        return "; ".join(parts)
+        return "; ".join(_format_event(evt) for evt in events)
     except HttpError as exc:
         logger.error("Google Calendar API error: %s", exc)
         return "Unable to fetch calendar events"
@@ -158,20 +281,9 @@ def get_upcoming_events(days_ahead: int = 7) -> Dict[str, Any]:
         service = get_calendar_service()
         if service is None:
             return {"success": False, "error": "Google Calendar authorization required", "events": []}
-        now = datetime.utcnow().replace(tzinfo=timezone.utc)
+        now = _now()
         end_time = now + timedelta(days=days_ahead)
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=now.isoformat(),
-                timeMax=end_time.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
-        events = [_normalize_event(evt) for evt in events_result.get("items", [])]
+        events = [_normalize_event(evt) for evt in _list_events(service, now, end_time)]
         return {"success": True, "events": events}
     except Exception as exc:
         logger.error("Error fetching upcoming events: %s", exc)
@@ -181,19 +293,8 @@ def get_next_meeting() -> Dict[str, Any]:
         service = get_calendar_service()
         if service is None:
             return {"success": False, "error": "Google Calendar authorization required", "event": {}}
-        now = datetime.utcnow().replace(tzinfo=timezone.utc)
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=now.isoformat(),
-                maxResults=1,
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
-        events = events_result.get("items", [])
+        now = _now()
+        events = _list_events(service, now, max_results=1)
         if not events:
             return {"success": True, "message": "No upcoming meetings", "event": {}}
         norm = _normalize_event(events[0])
@@ -205,61 +306,107 @@ def get_next_meeting() -> Dict[str, Any]:
     except Exception as exc:
         logger.error("Error getting next meeting: %s", exc)
         return {"success": False, "error": str(exc)}
+def _utc_clock(ts: int) -> str:
+    """HH:MM in UTC straight from epoch seconds."""
+    seconds = ts % 86400
+    return f"{seconds // 3600:02d}:{seconds % 3600 // 60:02d}"
+def _free_slot(start_ts: int, end_ts: int) -> Dict[str, Any]:
+    return {
+        "start": _utc_clock(start_ts),
+        "end": _utc_clock(end_ts),
+        "duration": int((end_ts - start_ts) // 60),
+    }
+def _free_slots(busy: List[Dict[str, str]], window_start: datetime, window_end: datetime) -> List[Dict[str, Any]]:
+    """Derive the free gaps inside a window from freebusy blocks using epoch-second arrays."""
+    day_start = int(window_start.timestamp())
+    day_end = int(window_end.timestamp())
+    if not busy:
+        return [_free_slot(day_start, day_end)] if day_start < day_end else []
+    count = len(busy)
+    starts = np.fromiter((_parse_iso(block["start"]).timestamp() for block in busy), dtype=np.int64, count=count)
+    ends = np.fromiter((_parse_iso(block["end"]).timestamp() for block in busy), dtype=np.int64, count=count)
+    order = starts.argsort(kind="stable")
+    starts = starts[order]
+    ends = ends[order]
+    # cursors[i] is the earliest free instant before busy block i (cursors[-1] is after the last one)
+    cursors = np.empty(count + 1, dtype=np.int64)
+    cursors[0] = day_start
+    cursors[1:] = np.maximum(np.maximum.accumulate(ends), day_start)
+    free_idx = np.flatnonzero(starts > cursors[:-1])
+    free_slots = [_free_slot(int(cursors[i]), int(starts[i])) for i in free_idx]
+    if cursors[-1] < day_end:
+        free_slots.append(_free_slot(int(cursors[-1]), day_end))
+    return free_slots
 def get_free_time_today() -> Dict[str, Any]:
     try:
         service = get_calendar_service()
         if service is None:
             return {"success": False, "error": "Google Calendar authorization required", "free_slots": []}
-        now = datetime.utcnow().replace(tzinfo=timezone.utc)
-        start_of_day = now.replace(hour=9, minute=0, second=0, microsecond=0)
-        end_of_day = now.replace(hour=17, minute=0, second=0, microsecond=0)
-        events_result = (
-            service.freebusy()
-            .query(
-                body={
-                    "timeMin": start_of_day.isoformat(),
-                    "timeMax": end_of_day.isoformat(),
-                    "items": [{"id": "primary"}],
-                }
-            )
-            .execute()
-        )
-        busy = events_result.get("calendars", {}).get("primary", {}).get("busy", [])
-        free_slots: List[Dict[str, Any]] = []
-        cursor = start_of_day
-        for block in busy:
-            busy_start = parser.isoparse(block["start"])
-            busy_end = parser.isoparse(block["end"])
-            if cursor < busy_start:
-                delta = busy_start - cursor
-                free_slots.append(
-                    {
-                        "start": cursor.strftime("%H:%M"),
-                        "end": busy_start.strftime("%H:%M"),
-                        "duration": int(delta.total_seconds() // 60),
-                    }
-                )
-            cursor = max(cursor, busy_end)
-        if cursor < end_of_day:
-            delta = end_of_day - cursor
-            free_slots.append(
-                {
-                    "start": cursor.strftime("%H:%M"),
-                    "end": end_of_day.strftime("%H:%M"),
-                    "duration": int(delta.total_seconds() // 60),
-                }
-            )
-        return {"success": True, "free_slots": free_slots}
+        today = _now().date()
+        start_of_day = datetime.combine(today, _WORKDAY_START, tzinfo=_UTC)
+        end_of_day = datetime.combine(today, _WORKDAY_END, tzinfo=_UTC)
+        busy = _query_busy(service, ("primary",), _rfc3339(start_of_day), _rfc3339(end_of_day))["primary"]
+        return {"success": True, "free_slots": _free_slots(busy, start_of_day, end_of_day)}
     except Exception as exc:
         logger.error("Error calculating free time: %s", exc)
         return {"success": False, "error": str(exc), "free_slots": []}
 # --------------------------- Write helpers ---------------------------
-def create_event_from_conversation(conversation_text: str) -> Dict[str, Any]:
+def _execute_batch(service, requests: List[Any]) -> List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """Send requests as multipart batches of at most _BATCH_LIMIT; (response, error) pairs keep input order."""
+    results: List[Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = [(None, None)] * len(requests)
+
+    def _collect(request_id, response, exception):
+        results[int(request_id)] = (response, exception)
+
+    for offset in range(0, len(requests), _BATCH_LIMIT):
+        batch = service.new_batch_http_request(callback=_collect)
+        for idx, request in enumerate(requests[offset:offset + _BATCH_LIMIT], start=offset):
+            batch.add(request, request_id=str(idx))
+        batch.execute()
+    return results
+def _is_resolved(text: str, parsed: Dict[str, Any], summary: str) -> bool:
+    """
+    True only when the local parse is unambiguous, so quickAdd is unnecessary: one explicit
+    clock time (or range) in the future and a real title free of day/date words.
+    """
+    if not parsed.get("success") or parsed.get("is_all_day") or "time_text" not in parsed:
+        return False
+    if parsed["start_datetime"] <= datetime.now():
+        return False
+    if _TIME_TOKEN_RE.search(text.replace(parsed["time_text"], " ", 1)):
+        return False
+    return summary not in PLACEHOLDER_SUMMARIES and not _DATE_WORD_RE.search(summary)
+@ttl_cache(maxsize=4, ttl=3600)
+def _calendar_timezone(service) -> Optional[str]:
+    """
+    IANA zone of the user's calendar, so locally parsed wall-clock times mean what quickAdd would make them.
+    None (cached like a success) when the token can't read settings, e.g. calendar.events-only grants.
+    """
+    try:
+        return service.settings().get(setting="timezone").execute()["value"]
+    except Exception as exc:
+        logger.info("Calendar timezone unavailable; events will go through quickAdd: %s", exc)
+        return None
+def _quick_add_result(event: Dict[str, Any]) -> Dict[str, Any]:
+    norm = _normalize_event(event)
+    message = (
+        f"Event created: '{norm['summary']}' on {norm.get('date')}"
+        + (f" at {norm['start_time']}" if norm.get("start_time") else "")
+    )
+    return {"success": True, "event": norm, "message": message}
+def _create_single_event(conversation_text: str) -> Dict[str, Any]:
     try:
         service = get_calendar_service()
         if service is None:
             return {"success": False, "error": "Google Calendar authorization required", "message": "Please authorize calendar access"}
         text = (conversation_text or "").strip()
+        # Resolve the event locally first; quickAdd costs a round-trip and is only
+        # needed when no explicit time or no usable title could be found.
+        parsed = parse_natural_language_datetime(text)
+        if _is_resolved(text, parsed, extract_event_summary(text)):
+            time_zone = _calendar_timezone(service)
+            if time_zone:
+                return manual_event_parser(text, get_calendar_service, parsed, time_zone)
         event = None
         try:
             event = (
@@ -270,17 +417,102 @@ def create_event_from_conversation(conversation_text: str) -> Dict[str, Any]:
         except HttpError as exc:
             if exc.resp.status == 400:
                 logger.info("QuickAdd failed; falling back to manual parse: %s", exc)
-                return manual_event_parser(text, get_calendar_service)
+                return manual_event_parser(text, get_calendar_service, parsed, _calendar_timezone(service) or "UTC")
             raise
-        norm = _normalize_event(event)
-        message = (
-            f"Event created: '{norm['summary']}' on {norm.get('date')}"
-            + (f" at {norm['start_time']}" if norm.get("start_time") else "")
-        )
-        return {"success": True, "event": norm, "message": message}
+        return _quick_add_result(event)
     except Exception as exc:
         logger.error("Error creating event from conversation: %s", exc)
         return {"success": False, "error": str(exc), "message": "Could not create event"}
+@_invalidates_reads
+def create_events_from_conversations(conversation_texts: List[str]) -> List[Dict[str, Any]]:
+    """Create several events with one batched round-trip; results follow the input order."""
+    try:
+        service = get_calendar_service()
+        if service is None:
+            return [
+                {"success": False, "error": "Google Calendar authorization required", "message": "Please authorize calendar access"}
+                for _ in conversation_texts
+            ]
+        plans = []
+        requests = []
+        for raw_text in conversation_texts:
+            text = (raw_text or "").strip()
+            parsed = parse_natural_language_datetime(text)
+            summary = extract_event_summary(text)
+            time_zone = _calendar_timezone(service) if _is_resolved(text, parsed, summary) else None
+            if time_zone:
+                body = build_event_body(summary, parsed, text, time_zone)
+                requests.append(service.events().insert(calendarId="primary", body=body, fields="id,htmlLink,summary"))
+            else:
+                summary = None
+                requests.append(service.events().quickAdd(calendarId="primary", text=text))
+            plans.append((text, parsed, summary))
+        results = []
+        for (text, parsed, summary), (event, error) in zip(plans, _execute_batch(service, requests)):
+            if error is None:
+                results.append(build_event_result(summary, parsed, event) if summary else _quick_add_result(event))
+            elif summary is None and isinstance(error, HttpError) and error.resp.status == 400:
+                logger.info("QuickAdd failed; falling back to manual parse: %s", error)
+                results.append(manual_event_parser(text, get_calendar_service, parsed, _calendar_timezone(service) or "UTC"))
+            else:
+                logger.error("Error creating event from conversation: %s", error)
+                results.append({"success": False, "error": str(error), "message": "Could not create event"})
+        return results
+    except Exception as exc:
+        logger.error("Error creating events from conversations: %s", exc)
+        return [{"success": False, "error": str(exc), "message": "Could not create event"} for _ in conversation_texts]
+class _PendingBatch:
+    """
+    Sends an event creation immediately when nothing is in flight; creations that
+    arrive while a send is running queue up and go out together as one batch after it.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._items: List[Tuple[str, Future]] = []
+        self._in_flight = False
+
+    def submit(self, conversation_text: str) -> Future:
+        future: Future = Future()
+        with self._lock:
+            self._items.append((conversation_text, future))
+            if self._in_flight:
+                return future
+            self._in_flight = True
+        # No send running: this caller leads and sends right away on its own thread
+        self._flush()
+        return future
+
+    def _flush(self) -> None:
+        with self._lock:
+            items, self._items = self._items, []
+        try:
+            self._send(items)
+        finally:
+            with self._lock:
+                followers = bool(self._items)
+                self._in_flight = followers
+            if followers:
+                # Hand the queued callers to a worker so the leader can return its own result now
+                threading.Thread(target=self._flush, name="calendar-batch", daemon=True).start()
+
+    @staticmethod
+    def _send(items: List[Tuple[str, Future]]) -> None:
+        texts = [text for text, _ in items]
+        try:
+            # A lone request skips the multipart envelope
+            results = [_create_single_event(texts[0])] if len(texts) == 1 else create_events_from_conversations(texts)
+        except Exception as exc:  # pragma: no cover - both paths already return error dicts
+            for _, future in items:
+                future.set_exception(exc)
+            return
+        for (_, future), result in zip(items, results):
+            future.set_result(result)
+_event_batcher = _PendingBatch()
+@_invalidates_reads
+def create_event_from_conversation(conversation_text: str) -> Dict[str, Any]:
+    """Create one event; callers arriving while another creation is in flight share the next batch round-trip."""
+    return _event_batcher.submit(conversation_text).result()
 # Backward-compatible wrapper name expected elsewhere
 create_event_manual_parse = manual_event_parser
 def test_calendar_connection() -> Dict[str, Any]:
@@ -297,6 +529,7 @@ __all__ = [
     "get_next_meeting",
     "get_free_time_today",
     "create_event_from_conversation",
+    "create_events_from_conversations",
     "create_event_manual_parse",
     "test_calendar_connection",
     "get_calendar_service",
@@ -0,0 +1,32 @@
+import logging
+
+from googleapiclient.model import JsonModel
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class OrjsonModel(JsonModel):
+    """googleapiclient response model that parses bodies with orjson instead of stdlib json."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Non-JSON bodies (e.g. empty deletes) keep the stock behaviour
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+def response_model():
+    """Return the fastest available response model, or None to let build() use its default."""
+    return OrjsonModel() if orjson is not None else None
+
+
+__all__ = ["OrjsonModel", "response_model"]
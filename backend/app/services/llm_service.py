@@ -1,38 +1,166 @@
 import json
 import logging
 import os
-from typing import Tuple
+import re
+import threading
+from typing import Callable, Optional, Tuple
 
-from flask import current_app
-from huggingface_hub import InferenceClient
+from flask import Flask, current_app
+from huggingface_hub import InferenceClient, InferenceTimeoutError
+
+from .reply_cache import ReplyCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 logger = logging.getLogger(__name__)
 
 HF_MODEL = "meta-llama/Meta-Llama-3-8B-Instruct"
+# Just above a typical completion; a straggler is retried once instead of pinning the worker
+HF_TIMEOUT = 8
+HF_RETRIES = 1
 
-# Updated Prompt for better intent recognition
+# Kept short: it is resent on every call, and keyword intents never reach the model
 SYSTEM_PROMPT = (
-    "You are a smart voice assistant. "
-    "Your goal is to classify user intent into JSON actions."
-    " Respond ONLY in valid JSON format with keys: 'action' and 'reply'.\n\n"
-    "RULES:\n"
-    "1. If the user mentions 'meet', 'book', 'schedule', 'appointment', or 'calendar', classify as 'schedule_meeting'.\n"
-    "2. If the user asks for weather, classify as 'weather'.\n"
-    "3. Otherwise, use 'general_response'.\n"
-    "4. 'reply' should be a short, friendly response spoken to the user.\n\n"
-    "Valid 'action' values: ['schedule_meeting', 'weather', 'general_response']"
+    "You are a friendly voice assistant. Reply ONLY as JSON "
+    '{"action": "schedule_meeting"|"weather"|"general_response", "reply": "<one short spoken sentence>"}.'
 )
 
 
+# Matches the action value as soon as it has fully streamed in
+ACTION_PATTERN = re.compile(r'"action"\s*:\s*"([^"]+)"')
+# The closing quote is optional so a reply cut off by max_tokens is still recovered
+REPLY_PATTERN = re.compile(r'"reply"\s*:\s*"((?:[^"\\]|\\.)*)(")?')
+FENCE_PATTERN = re.compile(r"```(?:json)?")
+JSON_OBJECT_PATTERN = re.compile(r"\{.*\}", re.DOTALL)
+
+# Scheduling and weather intents, applied locally so clear requests skip the model.
+# Stems, so "meeting", "booking", "rescheduled" and "appointments" match too.
+SCHEDULE_INTENT_PATTERN = re.compile(
+    r"\b(meet\w*|book\w*|\w*schedul\w*|appointments?|calendars?)\b", re.IGNORECASE
+)
+WEATHER_INTENT_PATTERN = re.compile(r"\bweather\b", re.IGNORECASE)
+
+_client: Optional[InferenceClient] = None
+_client_key: Optional[str] = None
+_client_lock = threading.Lock()
+
+# Parsed (action, reply) pairs for repeated or paraphrased utterances
+_reply_cache = ReplyCache(max_size=512)
+
+
 def _get_client():
+    """Return the process-wide client, rebuilding it only when the API key changes."""
+    global _client, _client_key
     api_key = current_app.config.get("HUGGINGFACE_API_KEY")
     if not api_key:
         logger.info("HUGGINGFACE_API_KEY not configured; skipping LLM call")
         return None
-    return InferenceClient(token=api_key)
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            _client = InferenceClient(token=api_key, timeout=HF_TIMEOUT)
+            _client_key = api_key
+        return _client
+
+
+def _ping_model(client: InferenceClient) -> None:
+    try:
+        # One-token request that wakes a cold serverless endpoint
+        client.chat_completion(
+            model=HF_MODEL,
+            messages=[{"role": "user", "content": "ping"}],
+            max_tokens=1,
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.info("LLM warm-up request failed: %s", exc)
+
+
+def warm_up_llm_client(app: Flask) -> None:
+    """
+    Build the shared client at startup so the first voice request doesn't pay for it.
+
+    With LLM_WARMUP set, also send a billed one-token completion from a
+    background thread to wake the model endpoint.
+    """
+    with app.app_context():
+        client = _get_client()
+    if client and app.config.get("LLM_WARMUP"):
+        threading.Thread(target=_ping_model, args=(client,), name="llm-warmup", daemon=True).start()
+
+
+def _fast_intent(user_text: str) -> Optional[Tuple[str, str]]:
+    """Classify keyword-driven intents without a model call; None means fall through to the LLM."""
+    if SCHEDULE_INTENT_PATTERN.search(user_text):
+        return "schedule_meeting", "Sure, let me set that up on your calendar."
+    if WEATHER_INTENT_PATTERN.search(user_text):
+        return "weather", "Let me check the weather for you."
+    return None
+
+
+def _stream_completion(client: InferenceClient, messages):
+    """Open the completion stream, retrying once if the endpoint times out."""
+    for attempt in range(HF_RETRIES + 1):
+        try:
+            return client.chat_completion(
+                model=HF_MODEL,
+                messages=messages,
+                max_tokens=60,
+                temperature=0.3,
+                stop=["}"],
+                stream=True,
+            )
+        except InferenceTimeoutError:
+            if attempt == HF_RETRIES:
+                raise
+            logger.info("Hugging Face request timed out; retrying")
+
+
+def _unescape(raw: str) -> str:
+    """Decode a JSON string body captured by REPLY_PATTERN, keeping it verbatim if malformed."""
+    try:
+        return _json_loads(f'"{raw}"')
+    except json.JSONDecodeError:
+        return raw
 
 
-def generate_action_reply(user_text: str) -> Tuple[str, str]:
+def _dispatch_action(on_action: Callable[[str], None], action: str) -> None:
+    try:
+        on_action(action)
+    except Exception as exc:  # pylint: disable=broad-except
+        logger.warning("Early action dispatch failed: %s", exc)
+
+
+def generate_action_reply(
+    user_text: str, on_action: Optional[Callable[[str], None]] = None
+) -> Tuple[str, str]:
+    """
+    Classify user_text and produce a spoken reply.
+
+    The completion is streamed; when on_action is given it is called once with
+    the action as soon as it appears, so callers can start work while the
+    reply is still being generated. Structured replies are cached per
+    normalized utterance (and, with LLM_SEMANTIC_CACHE, per close paraphrase),
+    so repeated phrases skip the model entirely. Scheduling and weather
+    requests are recognised by keyword and never reach the model.
+    """
+    intent = _fast_intent(user_text)
+    if intent is not None:
+        if on_action is not None:
+            _dispatch_action(on_action, intent[0])
+        return intent
+
+    semantic = bool(current_app.config.get("LLM_SEMANTIC_CACHE"))
+    cached = _reply_cache.get(user_text, semantic=semantic)
+    if cached is not None:
+        if on_action is not None:
+            _dispatch_action(on_action, cached[0])
+        return cached
+
     client = _get_client()
     if not client:
         return "general_response", "AI is not configured."
@@ -44,21 +172,31 @@ def generate_action_reply(user_text: str) -> Tuple[str, str]:
     ]
 
     try:
-        response = client.chat_completion(
-            model=HF_MODEL,
-            messages=messages,
-            max_tokens=150,
-            temperature=0.3,
-        )
-
-        # Extract the content from the response object
-        content = response.choices[0].message.content
+        stream = _stream_completion(client, messages)
+
+        # Accumulate the streamed deltas, dispatching the action early
+        content = ""
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            content += delta
+            if on_action is not None:
+                match = ACTION_PATTERN.search(content)
+                if match:
+                    _dispatch_action(on_action, match.group(1))
+                    on_action = None
 
         # Clean up potential markdown formatting (```json ... ```)
-        if "```" in content:
-            content = content.replace("```json", "").replace("```", "")
-
-        content = content.strip()
+        content = FENCE_PATTERN.sub("", content).strip()
+        # Decoding halts at the stop sequence, which may be left out of the text
+        candidate = content
+        if candidate.startswith("{") and not candidate.endswith("}"):
+            candidate += "}"
+        # Drop any prose the model put around the object
+        match = JSON_OBJECT_PATTERN.search(candidate)
+        if match:
+            candidate = match.group(0)
 
     except Exception as exc:
         logger.warning("Hugging Face generation failed: %s", exc)
@@ -69,12 +207,25 @@ def generate_action_reply(user_text: str) -> Tuple[str, str]:
     reply = "I understood, but couldn't generate a structured response."
 
     try:
-        data = json.loads(content)
+        data = _json_loads(candidate)
         if isinstance(data, dict):
             action = data.get("action") or action
             reply = data.get("reply") or reply
+            _reply_cache.put(user_text, (action, reply), semantic=semantic)
     except json.JSONDecodeError:
-        logger.warning("Failed to parse JSON from HF: %s", content)
-        reply = content  # Fallback: just speak the raw text
+        # The model sometimes wraps the object in prose; recover the fields directly
+        action_match = ACTION_PATTERN.search(content)
+        reply_match = REPLY_PATTERN.search(content)
+        if action_match:
+            action = action_match.group(1)
+        if reply_match:
+            reply = _unescape(reply_match.group(1))
+            if reply_match.group(2) is None:
+                # Truncated mid-reply: speak up to the last whole word
+                logger.info("HF reply truncated at max_tokens: %s", content)
+                reply = reply.rsplit(" ", 1)[0].rstrip(" ,;:") if " " in reply else reply
+        else:
+            logger.warning("Failed to parse JSON from HF: %s", content)
+            reply = content  # Fallback: just speak the raw text
 
     return action, reply
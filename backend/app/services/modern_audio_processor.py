@@ -4,7 +4,9 @@ Replaces deprecated audioop module with modern alternatives using soundfile, num
 """
 
 import sys
+import math
 import logging
+import threading
 import numpy as np
 from typing import Optional, Tuple, Union
 
@@ -25,6 +27,33 @@ except ImportError as e:
     sf = None
     scipy = None
 
+# G.711 u-law constants (ITU-T G.711, same algorithm as audioop)
+ULAW_BIAS = 0x84
+ULAW_CLIP = 8159
+ULAW_SEG_END = np.array([0x3F, 0x7F, 0xFF, 0x1FF, 0x3FF, 0x7FF, 0xFFF, 0x1FFF])
+
+def _build_ulaw_encode_table() -> np.ndarray:
+    """65536-entry table mapping every int16 sample (indexed by its uint16 bit pattern) to its u-law byte"""
+    samples = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.int32) >> 2
+    mask = np.where(samples < 0, 0x7F, 0xFF)
+    magnitude = np.minimum(np.abs(samples), ULAW_CLIP) + (ULAW_BIAS >> 2)
+    seg = np.searchsorted(ULAW_SEG_END, magnitude)
+    # Magnitudes past the last segment saturate to the largest code
+    uval = np.where(seg >= 8, 0x7F, (seg << 4) | ((magnitude >> (seg + 1)) & 0xF))
+    return (uval ^ mask).astype(np.uint8)
+
+def _build_ulaw_decode_table() -> np.ndarray:
+    """256-entry table mapping every u-law byte to its int16 sample"""
+    uval = ~np.arange(256, dtype=np.int32) & 0xFF
+    t = (((uval & 0x0F) << 3) + ULAW_BIAS) << ((uval & 0x70) >> 4)
+    return np.where(uval & 0x80, ULAW_BIAS - t, t - ULAW_BIAS).astype(np.int16)
+
+ULAW_ENCODE_TABLE = _build_ulaw_encode_table()
+ULAW_DECODE_TABLE = _build_ulaw_decode_table()
+
+# Smallest scratch buffer to allocate; covers a 20ms frame at 48kHz stereo with room to spare
+SCRATCH_MIN_SAMPLES = 4096
+
 class ModernAudioProcessor:
     """
     Modern replacement for audioop functions using soundfile, numpy, and scipy
@@ -33,6 +62,42 @@ class ModernAudioProcessor:
     
     def __init__(self):
         self.available = AUDIO_PROCESSING_AVAILABLE
+        # Working arrays reused across calls, one set per thread
+        self._tls = threading.local()
+        
+    def _scratch(self, n: int, dtype) -> np.ndarray:
+        """
+        Return an uninitialized length-n array backed by this thread's buffer for dtype
+        Valid until the next call asking for the same dtype on this thread
+        """
+        buffers = getattr(self._tls, 'buffers', None)
+        if buffers is None:
+            buffers = self._tls.buffers = {}
+        dtype = np.dtype(dtype)
+        buf = buffers.get(dtype)
+        if buf is None or buf.size < n:
+            buf = buffers[dtype] = np.empty(max(n, SCRATCH_MIN_SAMPLES), dtype=dtype)
+        return buf[:n]
+        
+    def _samples(self, fragment: bytes, dtype, nchannels: int = 1, slot: int = 0) -> np.ndarray:
+        """
+        View fragment as samples of dtype without copying
+        A trailing partial frame is zero-padded in a reused per-thread buffer instead of being rejected
+        """
+        frame_size = np.dtype(dtype).itemsize * nchannels
+        frames, remainder = divmod(len(fragment), frame_size)
+        if not remainder:
+            return np.frombuffer(fragment, dtype=dtype, count=frames * nchannels)
+        
+        size = (frames + 1) * frame_size
+        attr = f'pad{slot}'
+        pad = getattr(self._tls, attr, None)
+        if pad is None or len(pad) < size:
+            pad = bytearray(max(size, SCRATCH_MIN_SAMPLES))
+            setattr(self._tls, attr, pad)
+        pad[:len(fragment)] = fragment
+        pad[len(fragment):size] = bytes(size - len(fragment))
+        return np.frombuffer(pad, dtype=dtype, count=(frames + 1) * nchannels)
         
     def ratecv(self, fragment: bytes, width: int, nchannels: int, 
                inrate: int, outrate: int, state=None, 
@@ -57,40 +122,29 @@ class ModernAudioProcessor:
                 raise ValueError(f"Unsupported width: {width}")
                 
             # Convert bytes to numpy array
-            audio_data = np.frombuffer(fragment, dtype=dtype)
+            audio_data = self._samples(fragment, dtype, nchannels)
             
             # Reshape for multiple channels
             if nchannels > 1:
                 audio_data = audio_data.reshape(-1, nchannels)
             
-            # Convert to float for processing
-            audio_float = audio_data.astype(np.float32)
-            if width == 1:
-                audio_float /= 128.0
-            elif width == 2:
-                audio_float /= 32768.0
-            elif width == 4:
-                audio_float /= 2147483648.0
+            # The FIR runs in float anyway; no need to normalize to [-1, 1] first
+            audio_float = self._scratch(audio_data.size, np.float32 if width < 4 else np.float64)
+            audio_float = audio_float.reshape(audio_data.shape)
+            np.copyto(audio_float, audio_data)
             
-            # Resample using scipy
-            if nchannels == 1:
-                resampled = scipy.signal.resample(audio_float, 
-                                                 int(len(audio_float) * outrate / inrate))
-            else:
-                resampled = np.array([scipy.signal.resample(audio_float[:, ch], 
-                                                           int(len(audio_float) * outrate / inrate))
-                                     for ch in range(nchannels)]).T
+            # Polyphase FIR resampling; channels are filtered together along axis 0
+            g = math.gcd(inrate, outrate)
+            resampled = scipy.signal.resample_poly(audio_float, outrate // g, inrate // g, axis=0)
             
-            # Convert back to original format
-            if width == 1:
-                resampled = (resampled * 128.0).astype(np.int8)
-            elif width == 2:
-                resampled = (resampled * 32768.0).astype(np.int16)
-            elif width == 4:
-                resampled = (resampled * 2147483648.0).astype(np.int32)
+            # Filter overshoot must saturate rather than wrap around
+            info = np.iinfo(dtype)
+            np.clip(resampled, info.min, info.max, out=resampled)
+            out = self._scratch(resampled.size, dtype).reshape(resampled.shape)
+            np.copyto(out, resampled, casting='unsafe')
             
             # Convert back to bytes
-            return resampled.tobytes(), state
+            return out.tobytes(), state
             
         except Exception as e:
             logger.error(f"Error in ratecv: {e}")
@@ -99,41 +153,30 @@ class ModernAudioProcessor:
     def lin2ulaw(self, fragment: bytes, width: int) -> bytes:
         """
         Modern replacement for audioop.lin2ulaw
-        Convert linear samples to u-law encoding
+        Convert linear samples to G.711 u-law encoding via table lookup
         """
         if not self.available:
             logger.warning("Audio processing not available - returning original fragment")
             return fragment
             
         try:
-            # Convert bytes to numpy array
+            # Bring samples to 16 bits, the table's input width
             if width == 1:
-                dtype = np.int8
-                max_val = 128
+                samples = self._samples(fragment, np.int8)
+                audio_data = self._scratch(samples.size, np.int16)
+                np.left_shift(samples, 8, out=audio_data, dtype=np.int16)
             elif width == 2:
-                dtype = np.int16
-                max_val = 32768
+                audio_data = self._samples(fragment, np.int16)
             elif width == 4:
-                dtype = np.int32
-                max_val = 2147483648
+                samples = self._samples(fragment, np.int32)
+                audio_data = self._scratch(samples.size, np.int16)
+                np.right_shift(samples, 16, out=audio_data)
             else:
                 raise ValueError(f"Unsupported width: {width}")
-                
-            audio_data = np.frombuffer(fragment, dtype=dtype)
-            
-            # Normalize to [-1, 1]
-            normalized = audio_data.astype(np.float32) / max_val
-            
-            # Apply u-law compression
-            mu = 255.0
-            sign = np.sign(normalized)
-            abs_normalized = np.abs(normalized)
             
-            # u-law formula: sign(x) * ln(1 + mu * |x|) / ln(1 + mu)
-            compressed = sign * np.log(1 + mu * abs_normalized) / np.log(1 + mu)
-            
-            # Convert to 8-bit u-law
-            ulaw_data = (compressed * 127.0).astype(np.int8)
+            # The uint16 view indexes the encode table without copying
+            ulaw_data = self._scratch(audio_data.size, np.uint8)
+            np.take(ULAW_ENCODE_TABLE, audio_data.view(np.uint16), out=ulaw_data)
             
             return ulaw_data.tobytes()
             
@@ -144,31 +187,27 @@ class ModernAudioProcessor:
     def ulaw2lin(self, fragment: bytes, width: int) -> bytes:
         """
         Modern replacement for audioop.ulaw2lin
-        Convert u-law samples to linear encoding
+        Convert G.711 u-law samples to linear encoding via table lookup
         """
         if not self.available:
             logger.warning("Audio processing not available - returning original fragment")
             return fragment
             
         try:
-            # Convert u-law bytes to numpy array
-            ulaw_data = np.frombuffer(fragment, dtype=np.int8).astype(np.float32) / 127.0
-            
-            # Apply inverse u-law expansion
-            mu = 255.0
-            sign = np.sign(ulaw_data)
-            abs_ulaw = np.abs(ulaw_data)
-            
-            # Inverse u-law formula: sign(y) * (exp(|y| * ln(1 + mu)) - 1) / mu
-            expanded = sign * (np.exp(abs_ulaw * np.log(1 + mu)) - 1) / mu
+            # Decode to 16-bit samples
+            codes = self._samples(fragment, np.uint8)
+            expanded = self._scratch(codes.size, np.int16)
+            np.take(ULAW_DECODE_TABLE, codes, out=expanded)
             
             # Convert to target format
             if width == 1:
-                linear_data = (expanded * 128).astype(np.int8)
+                linear_data = self._scratch(codes.size, np.int8)
+                np.right_shift(expanded, 8, out=linear_data)
             elif width == 2:
-                linear_data = (expanded * 32768).astype(np.int16)
+                linear_data = expanded
             elif width == 4:
-                linear_data = (expanded * 2147483648).astype(np.int32)
+                linear_data = self._scratch(codes.size, np.int32)
+                np.left_shift(expanded, 16, out=linear_data, dtype=np.int32)
             else:
                 raise ValueError(f"Unsupported width: {width}")
                 
@@ -198,12 +237,15 @@ class ModernAudioProcessor:
             else:
                 raise ValueError(f"Unsupported width: {width}")
                 
-            audio_data = np.frombuffer(fragment, dtype=dtype)
+            audio_data = self._samples(fragment, dtype)
             
-            # Apply multiplication with clipping
-            multiplied = (audio_data.astype(np.float32) * factor).clip(
-                np.iinfo(dtype).min, np.iinfo(dtype).max
-            ).astype(dtype)
+            # Scale and clip in one working buffer; float64 keeps 32-bit samples exact
+            work = self._scratch(audio_data.size, np.float32 if width < 4 else np.float64)
+            np.copyto(work, audio_data)
+            np.multiply(work, factor, out=work)
+            np.clip(work, np.iinfo(dtype).min, np.iinfo(dtype).max, out=work)
+            multiplied = self._scratch(audio_data.size, dtype)
+            np.copyto(multiplied, work, casting='unsafe')
             
             return multiplied.tobytes()
             
@@ -231,18 +273,20 @@ class ModernAudioProcessor:
             else:
                 raise ValueError(f"Unsupported width: {width}")
                 
-            audio1 = np.frombuffer(fragment1, dtype=dtype)
-            audio2 = np.frombuffer(fragment2, dtype=dtype)
+            audio1 = self._samples(fragment1, dtype, slot=0)
+            audio2 = self._samples(fragment2, dtype, slot=1)
             
             # Make arrays same length
             min_len = min(len(audio1), len(audio2))
             audio1 = audio1[:min_len]
             audio2 = audio2[:min_len]
             
-            # Add with clipping
-            added = (audio1.astype(np.float32) + audio2.astype(np.float32)).clip(
-                np.iinfo(dtype).min, np.iinfo(dtype).max
-            ).astype(dtype)
+            # Add in a wider integer type, then saturate
+            acc = self._scratch(min_len, np.int32 if width < 4 else np.int64)
+            np.add(audio1, audio2, out=acc, dtype=acc.dtype)
+            np.clip(acc, np.iinfo(dtype).min, np.iinfo(dtype).max, out=acc)
+            added = self._scratch(min_len, dtype)
+            np.copyto(added, acc, casting='unsafe')
             
             return added.tobytes()
             
@@ -0,0 +1,120 @@
+import logging
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SIMILARITY_THRESHOLD = 0.92
+# Replies for these actions depend on the current time, so they are never reused
+UNCACHEABLE_ACTIONS = frozenset({"schedule_meeting"})
+
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+def normalize(user_text: str) -> str:
+    return WHITESPACE_PATTERN.sub(" ", user_text.lower().strip())
+
+
+class ReplyCache:
+    """
+    LRU of parsed (action, reply) pairs keyed on the normalized utterance,
+    with an optional nearest-neighbour lookup over sentence embeddings for
+    paraphrases of earlier prompts.
+    """
+
+    def __init__(self, max_size: int = 512, threshold: float = SIMILARITY_THRESHOLD) -> None:
+        self._max_size = max_size
+        self._threshold = threshold
+        self._entries: "OrderedDict[str, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        # The encoder is imported and loaded on first semantic use, under its own
+        # lock so exact-match lookups aren't blocked while torch spins up
+        self._encoder = None
+        self._encoder_lock = threading.Lock()
+        self._encoder_missing = False
+        # Row i of _vectors is the unit-length embedding of _vector_keys[i]
+        self._vector_keys: List[str] = []
+        self._vectors: Optional[np.ndarray] = None
+
+    def get(self, user_text: str, semantic: bool = False) -> Optional[Tuple[str, str]]:
+        key = normalize(user_text)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+        if not semantic:
+            return None
+
+        vector = self._embed(key)
+        if vector is None:
+            return None
+        with self._lock:
+            if self._vectors is None or not self._vector_keys:
+                return None
+            scores = self._vectors @ vector
+            best = int(scores.argmax())
+            if scores[best] < self._threshold:
+                return None
+            match = self._vector_keys[best]
+            self._entries.move_to_end(match)
+            return self._entries[match]
+
+    def put(self, user_text: str, result: Tuple[str, str], semantic: bool = False) -> None:
+        if result[0] in UNCACHEABLE_ACTIONS:
+            return
+        key = normalize(user_text)
+        vector = self._embed(key) if semantic else None
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if vector is not None and key not in self._vector_keys:
+                self._vector_keys.append(key)
+                row = vector[np.newaxis, :]
+                self._vectors = row if self._vectors is None else np.vstack((self._vectors, row))
+            while len(self._entries) > self._max_size:
+                evicted, _ = self._entries.popitem(last=False)
+                self._drop_vector(evicted)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._vector_keys = []
+            self._vectors = None
+
+    def _drop_vector(self, key: str) -> None:
+        try:
+            idx = self._vector_keys.index(key)
+        except ValueError:
+            return
+        del self._vector_keys[idx]
+        self._vectors = np.delete(self._vectors, idx, axis=0)
+
+    def _load_encoder(self):
+        if self._encoder is not None or self._encoder_missing:
+            return self._encoder
+        with self._encoder_lock:
+            if self._encoder is None and not self._encoder_missing:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                except ImportError:
+                    logger.warning("sentence-transformers not installed; semantic reply caching disabled")
+                    self._encoder_missing = True
+                    return None
+                logger.info("Loading %s for semantic reply caching", EMBEDDING_MODEL)
+                self._encoder = SentenceTransformer(EMBEDDING_MODEL)
+        return self._encoder
+
+    def _embed(self, key: str) -> Optional[np.ndarray]:
+        encoder = self._load_encoder()
+        if encoder is None:
+            return None
+        return np.asarray(encoder.encode(key, normalize_embeddings=True), dtype=np.float32)
+
+
+__all__ = ["ReplyCache", "normalize", "UNCACHEABLE_ACTIONS"]
@@ -3,11 +3,20 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 
 from dateutil import parser as date_parser
 
 
 DURATION_PATTERN = re.compile(r"(\d{1,3})\s?(minutes|min|hours|hrs|hour)", re.IGNORECASE)
+# Anything dateutil could read as a date or time; without one the fuzzy parse is skipped
+TIME_TOKEN_PATTERN = re.compile(
+    r"\d|\b(?:today|tonight|tomorrow|noon|midnight|next\s+week|[ap]m\b"
+    r"|mon|tue|wed|thu|fri|sat|sun|jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)",
+    re.IGNORECASE,
+)
+# Title is whatever follows the first "with"/"about"/"regarding"
+TITLE_SPLIT_PATTERN = re.compile(r"\b(?:with|about|regarding)\b(.*)$", re.IGNORECASE | re.DOTALL)
 TITLE_FALLBACK = "Voice Scheduled Meeting"
 
 
@@ -53,23 +62,29 @@ def _extract_duration(text: str) -> int:
 
 
 def _extract_datetime(text: str) -> datetime:
+    now = datetime.utcnow()
+    if not TIME_TOKEN_PATTERN.search(text):
+        return now + timedelta(hours=1)
+
     try:
-        parsed = date_parser.parse(text, fuzzy=True, default=datetime.utcnow())
+        # Defaulting to the top of the hour lets repeated commands hit the cache
+        parsed = _parse_datetime(text, now.replace(minute=0, second=0, microsecond=0))
         # Ensure future time preference
-        if parsed < datetime.utcnow():
+        if parsed < now:
             parsed = parsed + timedelta(days=1)
         return parsed
     except (ValueError, OverflowError):
-        return datetime.utcnow() + timedelta(hours=1)
+        return now + timedelta(hours=1)
 
 
-def _extract_title(text: str) -> str:
-    lowered = text.lower()
-    keywords = ["with", "about", "regarding"]
+@lru_cache(maxsize=1024)
+def _parse_datetime(text: str, default: datetime) -> datetime:
+    return date_parser.parse(text, fuzzy=True, default=default)
 
-    for keyword in keywords:
-        if keyword in lowered:
-            portion = text.split(keyword, maxsplit=1)[-1].strip()
-            return portion.title()
+
+def _extract_title(text: str) -> str:
+    match = TITLE_SPLIT_PATTERN.search(text)
+    if match:
+        return match.group(1).strip().title()
 
     return text[:60].strip().title()